@@ -258,6 +258,14 @@ class LibUsbLibrary:
         lib.libusb_set_auto_detach_kernel_driver.argtypes = [LibUsbDeviceHandlePtr, ctypes.c_int]
         lib.libusb_set_auto_detach_kernel_driver.restype = ctypes.c_int
 
+        # The device memory functions were introduced in libusb 1.0.21. They are optional.
+        if hasattr(lib, "libusb_dev_mem_alloc"):
+            lib.libusb_dev_mem_alloc.argtypes = [LibUsbDeviceHandlePtr, ctypes.c_size_t]
+            lib.libusb_dev_mem_alloc.restype = ctypes.c_void_p
+
+            lib.libusb_dev_mem_free.argtypes = [LibUsbDeviceHandlePtr, ctypes.c_void_p, ctypes.c_size_t]
+            lib.libusb_dev_mem_free.restype = ctypes.c_int
+
     def _libusb_exception(self, error_code: int) -> LibUsbLibraryFunctionCallError:
         """Look up the description of the error and return a LibUsbError exception."""
         error_message = self.get_error_name(error_code)
@@ -343,19 +351,76 @@ class LibUsbLibrary:
         if transferred.value != len(data):
             raise LibUsbLibraryMiscellaneousError("Expected the value of transferred to be equal to the number of bytes received.")
 
+    def bulk_transfer_out_from(self, device_handle: LibUsbDeviceHandlePtr, endpoint: int, buffer: ctypes.Array,
+                               size: int, timeout: int) -> None:
+        """Execute a bulk-out transfer of the first 'size' bytes of a caller-provided buffer.
+
+        This allows a single buffer to be reused for many transfers.
+        """
+
+        if size > ctypes.sizeof(buffer):
+            raise LibUsbLibraryMiscellaneousError("Buffer is too small for the requested transfer size.")
+
+        transferred = ctypes.c_int()
+
+        result = self._lib.libusb_bulk_transfer(
+            device_handle, endpoint, ctypes.cast(buffer, ctypes.POINTER(ctypes.c_ubyte)), size, transferred, timeout)
+        if result != LIBUSB_SUCCESS:
+            raise self._libusb_exception(result)
+
+        if transferred.value != size:
+            raise LibUsbLibraryMiscellaneousError("Expected the value of transferred to be equal to the number of bytes sent.")
+
     def bulk_transfer_in(self, device_handle: LibUsbDeviceHandlePtr, endpoint: int, maxsize: int, timeout: int) -> bytes:
         """Execute a bulk-in transfer."""
 
         data = ctypes.create_string_buffer(maxsize)
 
+        transferred = self.bulk_transfer_in_into(device_handle, endpoint, data, maxsize, timeout)
+
+        return data[:transferred]
+
+    def bulk_transfer_in_into(self, device_handle: LibUsbDeviceHandlePtr, endpoint: int, buffer: ctypes.Array,
+                              maxsize: int, timeout: int) -> int:
+        """Execute a bulk-in transfer into a caller-provided buffer; return the number of bytes received.
+
+        This allows a single buffer to be reused for many transfers.
+        """
+
+        if maxsize > ctypes.sizeof(buffer):
+            raise LibUsbLibraryMiscellaneousError("Buffer is too small for the requested transfer size.")
+
         transferred = ctypes.c_int()
 
         result = self._lib.libusb_bulk_transfer(
-            device_handle, endpoint, ctypes.cast(data, ctypes.POINTER(ctypes.c_ubyte)), maxsize, transferred, timeout)
+            device_handle, endpoint, ctypes.cast(buffer, ctypes.POINTER(ctypes.c_ubyte)), maxsize, transferred, timeout)
         if result != LIBUSB_SUCCESS:
             raise self._libusb_exception(result)
 
-        return data[:transferred.value]
+        return transferred.value
+
+    def dev_mem_alloc(self, device_handle: LibUsbDeviceHandlePtr, size: int) -> Optional[ctypes.Array]:
+        """Allocate device memory that can be used for zero-copy transfers.
+
+        Returns None if device memory is not supported by the libusb version or the platform (it is currently
+        only available on Linux). In that case, the caller should fall back to an ordinary buffer.
+
+        Note: the memory should be freed by calling `dev_mem_free` before the device handle is closed.
+        """
+        if not hasattr(self._lib, "libusb_dev_mem_alloc"):
+            return None
+
+        address = self._lib.libusb_dev_mem_alloc(device_handle, size)
+        if address is None:
+            return None
+
+        return (ctypes.c_ubyte * size).from_address(address)
+
+    def dev_mem_free(self, device_handle: LibUsbDeviceHandlePtr, buffer: ctypes.Array) -> None:
+        """Free device memory that was allocated using `dev_mem_alloc`."""
+        result = self._lib.libusb_dev_mem_free(device_handle, ctypes.addressof(buffer), ctypes.sizeof(buffer))
+        if result != LIBUSB_SUCCESS:
+            raise self._libusb_exception(result)
 
     def get_string_descriptor_languages(self, device_handle: LibUsbDeviceHandlePtr, timeout: int) -> list[int]:
         """Request languages supported by the device as LANGID values.
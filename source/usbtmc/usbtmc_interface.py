@@ -63,6 +63,11 @@ class UsbDeviceInfo(NamedTuple):
     product: str                  # Product name, as read from the device descriptor.
     serial_number: Optional[str]  # Serial number, as read from the device descriptor. May be absent.
 
+    @property
+    def model_string(self) -> str:
+        """Device model as a single string: the manufacturer name followed by the product name."""
+        return f"{self.manufacturer} {self.product}"
+
 
 class UsbTmcInterfaceInfo(NamedTuple):
     """USBTMC interface info."""
@@ -258,6 +263,13 @@ class UsbTmcInterface:
         self._usbtmc_info = None
         self._bulk_out_btag: Optional[int] = None
         self._rsb_btag: Optional[int] = None
+        self._bulk_in_buffer: Optional[ctypes.Array] = None
+        self._bulk_out_buffer: Optional[ctypes.Array] = None
+        self._dev_mem_buffers: list[ctypes.Array] = []
+        # Responses that cannot change while the device is open are cached.
+        self._string_descriptor_languages: Optional[list[int]] = None
+        self._capabilities: Optional[UsbTmcInterfaceCapabilities] = None
+        self._device_info: dict[int, UsbDeviceInfo] = {}
 
     def __enter__(self):
         self.open()
@@ -301,6 +313,10 @@ class UsbTmcInterface:
         self._usbtmc_info = usbtmc_info
         self._bulk_out_btag = 0  # Will be incremented to 1 at first invocation _get_next_bulk_out_btag.
         self._rsb_btag = 1  # Will be incremented to 2 at first invocation of _get_next_rsb_btag.
+        # A single receive buffer and a single send buffer are allocated for the device, and reused for all
+        # Bulk-IN and message Bulk-OUT transfers, respectively. The send buffer has room for up to 3 padding bytes.
+        self._bulk_in_buffer = self._allocate_transfer_buffer(self._behavior.max_bulk_in_transfer_size)
+        self._bulk_out_buffer = self._allocate_transfer_buffer(self._behavior.max_bulk_out_transfer_size + 3)
 
         try:
             # We reset the interface using the method specified by the device behavior's reset-at-open policy.
@@ -329,16 +345,28 @@ class UsbTmcInterface:
         # Let the operating system know we're done with it.
         self._release_interface()
 
-        # Close the device handle.
         libusb = UsbTmcInterface._usbtmc_libusb_manager.get_libusb()
-        libusb.close(self._device_handle)
 
-        # Set all device-specific fields to None. They will need to be re-initialized when the device is reopened.
-        self._libusb = None
-        self._device_handle = None
-        self._usbtmc_info = None
-        self._bulk_out_btag = None
-        self._rsb_btag = None
+        try:
+            # Free the device memory; this must be done while the device handle is still open.
+            for buffer in self._dev_mem_buffers:
+                libusb.dev_mem_free(self._device_handle, buffer)
+        finally:
+            # Even if freeing the device memory failed, close the device handle.
+            libusb.close(self._device_handle)
+
+            # Set all device-specific fields to None. They will need to be re-initialized when the device is reopened.
+            self._libusb = None
+            self._device_handle = None
+            self._usbtmc_info = None
+            self._bulk_out_btag = None
+            self._rsb_btag = None
+            self._bulk_in_buffer = None
+            self._bulk_out_buffer = None
+            self._dev_mem_buffers = []
+            self._string_descriptor_languages = None
+            self._capabilities = None
+            self._device_info = {}
 
     def _control_transfer(self, request: ControlRequest, w_value: int, w_length: int) -> bytes:
         """Perform a control transfer to the USBTMC interface."""
@@ -403,18 +431,36 @@ class UsbTmcInterface:
 
         self._libusb.release_interface(self._device_handle, self._usbtmc_info.interface_number)
 
+    def _allocate_transfer_buffer(self, size: int) -> ctypes.Array:
+        """Allocate a buffer for bulk transfers.
+
+        Where libusb supports it, device memory is used; this allows the operating system to perform the
+        transfer directly from or into the buffer, without copying the data. Otherwise, an ordinary buffer is used.
+        """
+        buffer = self._libusb.dev_mem_alloc(self._device_handle, size)
+        if buffer is None:
+            return ctypes.create_string_buffer(size)
+        self._dev_mem_buffers.append(buffer)
+        return buffer
+
     def _calculate_bulk_timeout(self, num_octets: int) -> int:
         """Return a pessimistic estimate for the time a bulk transfer can take, in milliseconds."""
         return self._short_timeout + round(num_octets / self._min_bulk_speed)
 
-    def _bulk_transfer_in(self, max_size: int) -> bytes:
-        """Perform a single BULK-IN transfer."""
+    def _bulk_transfer_in(self, max_size: int) -> memoryview:
+        """Perform a single BULK-IN transfer.
+
+        The data received is returned as a view on the receive buffer, to avoid copying it.
+        Note that the view is only valid until the next BULK-IN transfer.
+        """
 
         if self._libusb is None:
             raise UsbTmcGenericError("The interface is not open.")
 
         timeout = self._calculate_bulk_timeout(max_size)
-        return self._libusb.bulk_transfer_in(self._device_handle, self._usbtmc_info.bulk_in_endpoint, max_size, timeout)
+        transferred = self._libusb.bulk_transfer_in_into(self._device_handle, self._usbtmc_info.bulk_in_endpoint,
+                                                         self._bulk_in_buffer, max_size, timeout)
+        return memoryview(self._bulk_in_buffer).cast('B')[:transferred]
 
     def _bulk_transfer_out(self, transfer: bytes) -> None:
         """Perform a single BULK-OUT transfer."""
@@ -425,13 +471,29 @@ class UsbTmcInterface:
         timeout = self._calculate_bulk_timeout(len(transfer))
         self._libusb.bulk_transfer_out(self._device_handle, self._usbtmc_info.bulk_out_endpoint, transfer, timeout)
 
+    def _bulk_transfer_out_from_buffer(self, size: int) -> None:
+        """Perform a single BULK-OUT transfer of the first 'size' bytes of the send buffer."""
+
+        if self._libusb is None:
+            raise UsbTmcGenericError("The interface is not open.")
+
+        timeout = self._calculate_bulk_timeout(size)
+        self._libusb.bulk_transfer_out_from(self._device_handle, self._usbtmc_info.bulk_out_endpoint,
+                                            self._bulk_out_buffer, size, timeout)
+
     def get_string_descriptor_languages(self) -> list[int]:
-        """Get supported string descriptor languages."""
+        """Get supported string descriptor languages.
+
+        The languages are read from the device only once; subsequent calls return a copy of the cached list.
+        """
 
         if self._device_handle is None:
             raise UsbTmcGenericError("The interface is not open.")
 
-        return self._libusb.get_string_descriptor_languages(self._device_handle, self._short_timeout)
+        if self._string_descriptor_languages is None:
+            self._string_descriptor_languages = self._libusb.get_string_descriptor_languages(self._device_handle, self._short_timeout)
+
+        return list(self._string_descriptor_languages)
 
     def get_string_descriptor(self, descriptor_index: int, langid: int = LANGID_ENGLISH_US) -> str:
         """Get string descriptor from device."""
@@ -448,7 +510,15 @@ class UsbTmcInterface:
         return response
 
     def get_device_info(self, *, langid: int = LANGID_ENGLISH_US) -> UsbDeviceInfo:
-        """Convenience method for getting human-readable information about the currently open USBTMC device."""
+        """Convenience method for getting human-readable information about the currently open USBTMC device.
+
+        The information is read from the device only once per language; subsequent calls return the cached value.
+        """
+
+        device_info = self._device_info.get(langid)
+        if device_info is not None:
+            return device_info
+
         libusb = UsbTmcInterface._usbtmc_libusb_manager.get_libusb()
         device_handle = self._device_handle
 
@@ -461,45 +531,113 @@ class UsbTmcInterface:
         product = self.get_string_descriptor(device_descriptor.iProduct, langid=langid)
         serial_number = self.get_string_descriptor(device_descriptor.iSerialNumber, langid=langid)
 
-        return UsbDeviceInfo(vid_pid, manufacturer, product, serial_number)
+        device_info = UsbDeviceInfo(vid_pid, manufacturer, product, serial_number)
+
+        self._device_info[langid] = device_info
+
+        return device_info
+
+    def get_used_string_indices(self) -> set[int]:
+        """Get the string descriptor indices referenced by the device, configuration, and interface descriptors.
+
+        The descriptors are cached by libusb, so no USB transfers are needed to determine the indices.
+        Index 0 (meaning: no string descriptor) is never included in the result.
+        """
+
+        if self._libusb is None:
+            raise UsbTmcGenericError("The interface is not open.")
+
+        device = self._libusb.get_device(self._device_handle)
+        device_descriptor = self._libusb.get_device_descriptor(device)
+
+        indices = {device_descriptor.iManufacturer, device_descriptor.iProduct, device_descriptor.iSerialNumber}
+
+        for config_index in range(device_descriptor.bNumConfigurations):
+            config_descriptor = self._libusb.get_config_descriptor(device, config_index)
+            try:
+                indices.add(config_descriptor.contents.iConfiguration)
+                for interface_index in range(config_descriptor.contents.bNumInterfaces):
+                    interface = config_descriptor.contents.interface[interface_index]
+                    for altsetting_index in range(interface.num_altsetting):
+                        indices.add(interface.altsetting[altsetting_index].iInterface)
+            finally:
+                self._libusb.free_config_descriptor(config_descriptor)
+
+        indices.discard(0)
+
+        return indices
 
     def get_usbtmc_interface_info(self) -> Optional[UsbTmcInterfaceInfo]:
         """Get the USBTMC interface info as read when the device was opened."""
         return self._usbtmc_info
 
-    def write_message(self, *args: (str | bytes), encoding: str = 'ascii'):
-        """Write USBTMC message to the BULK-OUT endpoint."""
+    def write_message(self, *args: (str | bytes | bytearray | memoryview), encoding: str = 'ascii'):
+        """Write USBTMC message to the BULK-OUT endpoint.
 
-        # Collect all arguments into a single byte array.
-        message = bytearray()
+        The message consists of the concatenation of all arguments. Rather than joining the arguments into a
+        single message up front, each transfer is assembled directly from the arguments in the send buffer.
+        This avoids making a complete copy of large binary messages such as waveforms.
+
+        Other buffer objects, such as an array.array or a numpy array, can be passed by wrapping them in a memoryview.
+        """
+
+        if self._bulk_out_buffer is None:
+            raise UsbTmcGenericError("The interface is not open.")
+
+        # Represent all arguments as byte-oriented memoryviews.
+        parts = []
         for arg in args:
             if isinstance(arg, str):
                 arg = arg.encode(encoding)
-            if not isinstance(arg, (bytes, bytearray)):
-                raise UsbTmcGenericError("Bad argument (expected only strings, bytes, and bytearray).")
-            message.extend(arg)
+            if not isinstance(arg, (bytes, bytearray, memoryview)):
+                raise UsbTmcGenericError("Bad argument (expected only strings, bytes, bytearray, and memoryview).")
+            parts.append(memoryview(arg).cast('B'))
 
-        if len(message) == 0:
+        message_size = sum(len(part) for part in parts)
+
+        if message_size == 0:
             # The USBTMC standard forbids Host-to-Device bulk transfers without payload,
             # meaning we have no way to handle zero-byte messages.
             raise UsbTmcGenericError("Unable to send a zero-length message.")
 
         max_payload_size = self._behavior.max_bulk_out_transfer_size - BULK_TRANSFER_HEADER_SIZE
 
+        transfer = memoryview(self._bulk_out_buffer).cast('B')
+
+        # The position in the message where the payload of the next transfer starts, as a (part, offset) pair.
+        part_index = 0
+        part_offset = 0
+
         offset = 0
-        while offset != len(message):
+        while offset != message_size:
             btag = self._get_next_bulk_out_btag()
-            payload_size = min(max_payload_size, len(message) - offset)
-            if offset + payload_size == len(message):
+            payload_size = min(max_payload_size, message_size - offset)
+            if offset + payload_size == message_size:
                 transfer_attributes = 0x01  # End-Of-Message
             else:
                 transfer_attributes = 0x00  # Not End-Of-Message
 
-            header = struct.pack("<BBBxLB3x", BulkMessageID.USBTMC_DEV_DEP_MSG_OUT, btag, btag ^ 0xff, payload_size, transfer_attributes)
-            padding = bytes(-payload_size % 4)
-            transfer = header + message[offset:offset + payload_size] + padding
+            struct.pack_into("<BBBxLB3x", transfer, 0, BulkMessageID.USBTMC_DEV_DEP_MSG_OUT, btag, btag ^ 0xff, payload_size, transfer_attributes)
+            transfer_size = BULK_TRANSFER_HEADER_SIZE
 
-            self._bulk_transfer_out(transfer)
+            # Gather the payload of this transfer from the message parts.
+            remaining_size = payload_size
+            while remaining_size != 0:
+                part = parts[part_index]
+                chunk = part[part_offset:part_offset + remaining_size]
+                transfer[transfer_size:transfer_size + len(chunk)] = chunk
+                transfer_size += len(chunk)
+                remaining_size -= len(chunk)
+                part_offset += len(chunk)
+                if part_offset == len(part):
+                    part_index += 1
+                    part_offset = 0
+
+            padding_size = -payload_size % 4
+            transfer[transfer_size:transfer_size + padding_size] = bytes(padding_size)
+            transfer_size += padding_size
+
+            self._bulk_transfer_out_from_buffer(transfer_size)
 
             offset += payload_size
 
@@ -529,22 +667,6 @@ class UsbTmcInterface:
             if len(transfer) < BULK_TRANSFER_HEADER_SIZE:
                 raise UsbTmcGenericError(f"Bulk-in transfer is too short ({len(transfer)} bytes).")
 
-            if len(transfer) % self._usbtmc_info.bulk_in_endpoint_max_packet_size == 0:
-
-                # From to the USBTMC specification:
-                #
-                # "The device must always terminate a Bulk-IN transfer by sending a short packet. The short packet
-                #  may be zero-length or non zero-length. The device may send extra alignment bytes (up to
-                #  wMaxPacketSize – 1) to avoid sending a zero-length packet. The alignment bytes should be 0x00-
-                #  valued, but this is not required. A device is not required to send any alignment bytes."
-                #
-                # In accordance with this, we expect to see a short packet here.
-
-                max_dummy_size = self._usbtmc_info.bulk_in_endpoint_max_packet_size
-                dummy_transfer = self._bulk_transfer_in(max_dummy_size)
-                if len(dummy_transfer) >= self._usbtmc_info.bulk_in_endpoint_max_packet_size:
-                    raise UsbTmcGenericError("Bad dummy packet received.")
-
             (message_id, btag_in, btag_in_inv, payload_size, transfer_attributes) = struct.unpack_from("<BBBxLB3x", transfer)
 
             if message_id != BulkMessageID.USBTMC_DEV_DEP_MSG_IN:
@@ -556,11 +678,16 @@ class UsbTmcInterface:
             if self._behavior.bad_bulk_in_transfer_size:
                 # QUIRK:
                 # Header + payload sizes should add up to the transfer length, but some devices mess this up.
-                pass
+                # We cannot trust the payload size, so we take everything that follows the header.
+                payload_end = len(transfer)
             else:
                 # Normal behavior, compliant with the specification.
-                if payload_size != len(transfer) - BULK_TRANSFER_HEADER_SIZE:
+                # The payload may be followed by up to 3 padding bytes, and by alignment bytes (up to wMaxPacketSize - 1)
+                # that the device may send to avoid a zero-length packet. Neither is included in the payload size.
+                num_extra_bytes = len(transfer) - BULK_TRANSFER_HEADER_SIZE - payload_size
+                if not (0 <= num_extra_bytes <= self._usbtmc_info.bulk_in_endpoint_max_packet_size + 2):
                     raise UsbTmcGenericError("Bulk-in transfer: bad payload size.")
+                payload_end = BULK_TRANSFER_HEADER_SIZE + payload_size
 
             if payload_size == 0:
                 # The USBTMC standard forbids this.
@@ -568,7 +695,24 @@ class UsbTmcInterface:
 
             end_of_message = (transfer_attributes & 0x01) != 0
 
-            message.extend(transfer[BULK_TRANSFER_HEADER_SIZE:])
+            # Copy the payload out of the receive buffer before it is reused by the next BULK-IN transfer.
+            message.extend(transfer[BULK_TRANSFER_HEADER_SIZE:payload_end])
+
+            if len(transfer) % self._usbtmc_info.bulk_in_endpoint_max_packet_size == 0:
+
+                # From to the USBTMC specification:
+                #
+                # "The device must always terminate a Bulk-IN transfer by sending a short packet. The short packet
+                #  may be zero-length or non zero-length. The device may send extra alignment bytes (up to
+                #  wMaxPacketSize – 1) to avoid sending a zero-length packet. The alignment bytes should be 0x00-
+                #  valued, but this is not required. A device is not required to send any alignment bytes."
+                #
+                # In accordance with this, we expect to see a short packet here.
+
+                max_dummy_size = self._usbtmc_info.bulk_in_endpoint_max_packet_size
+                dummy_transfer = self._bulk_transfer_in(max_dummy_size)
+                if len(dummy_transfer) >= self._usbtmc_info.bulk_in_endpoint_max_packet_size:
+                    raise UsbTmcGenericError("Bad dummy packet received.")
 
             if end_of_message:
                 # End Of Message was set on the last transfer; the message is complete.
@@ -702,27 +846,38 @@ class UsbTmcInterface:
 
         This request is described in the USBTMC protocol standard, section 4.2.1.8.
         Extended capabilities for the USB488 sub-protocol are described in the USBTMC-USB488 sub-protocol standard, section 4.2.2.
+
+        The capabilities are read from the device only once; subsequent calls return the cached value.
         """
+
+        if self._capabilities is not None:
+            return self._capabilities
+
         response = self._control_transfer(ControlRequest.USBTMC_GET_CAPABILITIES, 0x0000, 24)
         if response[0] != ControlStatus.USBTMC_SUCCESS:
             raise UsbTmcControlResponseError(ControlRequest.USBTMC_GET_CAPABILITIES, ControlStatus(response[0]))
 
+        # Extract the response octets at offsets 4, 5, and 12..15 in a single unpack operation.
+        (octet4, octet5, octet12, octet13, octet14, octet15) = struct.unpack_from("<4xBB6xBBBB", response)
+
         capabilities = UsbTmcInterfaceCapabilities(
-            usbtmc_interface_version                              = (_from_bcd(response[5]), _from_bcd(response[4])),
-            usbtmc_interface_supports_indicator_pulse             = ((response[4] >> 2) & 1) != 0,
-            usbtmc_interface_is_talk_only                         = ((response[4] >> 1) & 1) != 0,
-            usbtmc_interface_is_listen_only                       = ((response[4] >> 0) & 1) != 0,
-            usbtmc_interface_supports_termchar_feature            = ((response[5] >> 0) & 1) != 0,
-            usb488_interface_version                              = (_from_bcd(response[13]), _from_bcd(response[12])),
-            usb488_interface_is_488v2                             = ((response[14] >> 2) & 1) != 0,
-            usb488_interface_accepts_remote_local_commands        = ((response[14] >> 1) & 1) != 0,
-            usb488_interface_accepts_trigger_command              = ((response[14] >> 0) & 1) != 0,
-            usb488_interface_supports_all_mandatory_scpi_commands = ((response[15] >> 3) & 1) != 0,
-            usb488_interface_device_is_sr1_capable                = ((response[15] >> 2) & 1) != 0,
-            usb488_interface_device_is_rl1_capable                = ((response[15] >> 1) & 1) != 0,
-            usb488_interface_device_is_dt1_capable                = ((response[15] >> 0) & 1) != 0
+            usbtmc_interface_version                              = (_from_bcd(octet5), _from_bcd(octet4)),
+            usbtmc_interface_supports_indicator_pulse             = ((octet4 >> 2) & 1) != 0,
+            usbtmc_interface_is_talk_only                         = ((octet4 >> 1) & 1) != 0,
+            usbtmc_interface_is_listen_only                       = ((octet4 >> 0) & 1) != 0,
+            usbtmc_interface_supports_termchar_feature            = ((octet5 >> 0) & 1) != 0,
+            usb488_interface_version                              = (_from_bcd(octet13), _from_bcd(octet12)),
+            usb488_interface_is_488v2                             = ((octet14 >> 2) & 1) != 0,
+            usb488_interface_accepts_remote_local_commands        = ((octet14 >> 1) & 1) != 0,
+            usb488_interface_accepts_trigger_command              = ((octet14 >> 0) & 1) != 0,
+            usb488_interface_supports_all_mandatory_scpi_commands = ((octet15 >> 3) & 1) != 0,
+            usb488_interface_device_is_sr1_capable                = ((octet15 >> 2) & 1) != 0,
+            usb488_interface_device_is_rl1_capable                = ((octet15 >> 1) & 1) != 0,
+            usb488_interface_device_is_dt1_capable                = ((octet15 >> 0) & 1) != 0
         )
 
+        self._capabilities = capabilities
+
         return capabilities
 
     def indicator_pulse(self) -> None:
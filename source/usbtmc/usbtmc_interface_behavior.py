@@ -22,8 +22,10 @@ class ResetAtOpenPolicyFlag(Flag):
 class UsbTmcInterfaceBehavior(NamedTuple):
     """USBTMC interface behaviors and quirks."""
     # In-spec behaviors.
-    max_bulk_in_transfer_size = 16384
-    max_bulk_out_transfer_size = 16384
+    # The maximum transfer sizes (including the 12-byte header) determine how many USB round-trips are needed
+    # per message. Devices that handle larger transfers can be given larger values to speed up big messages.
+    max_bulk_in_transfer_size: int = 16384
+    max_bulk_out_transfer_size: int = 16384
     # Out-of-spec behaviors (a.k.a. quirks).
     reset_at_open_policy: ResetAtOpenPolicyFlag = ResetAtOpenPolicyFlag.CLEAR_INTERFACE
     clear_usbtmc_interface_disabled: bool = False
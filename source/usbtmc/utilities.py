@@ -1,12 +1,15 @@
 """USBTMC utility functions."""
 
-from io import BytesIO
 import os
 import sys
+from typing import Optional
 
 import usbtmc
 from usbtmc import UsbTmcInterface
 
+# Result of the first call to initialize_libusb_library_path_environment_variable(), or None if not yet called.
+_libusb_library_path_initialized: Optional[bool] = None
+
 
 def initialize_libusb_library_path_environment_variable() -> bool:
     """Initialize the LIBUSB_LIBRARY_PATH environment variable, if needed.
@@ -15,9 +18,17 @@ def initialize_libusb_library_path_environment_variable() -> bool:
     pointing the LIBUSB_LIBRARY_PATH environment variable to the libusb-1.0 DLL.
 
     If the LIBUSB_LIBRARY_PATH variable is already set, or on non-Windows platforms, this function is a no-op.
+
+    The outcome of the first call is remembered; subsequent calls return it without looking for the DLL again.
     """
 
+    global _libusb_library_path_initialized
+
+    if _libusb_library_path_initialized is not None:
+        return _libusb_library_path_initialized
+
     if ("LIBUSB_LIBRARY_PATH" in os.environ) or (sys.platform != "win32"):
+        _libusb_library_path_initialized = False
         return False
 
     filename = os.path.abspath(os.path.join(os.path.dirname(usbtmc.__file__), "../../windows/libusb-1.0.dll"))
@@ -26,49 +37,74 @@ def initialize_libusb_library_path_environment_variable() -> bool:
 
     os.environ["LIBUSB_LIBRARY_PATH"] = filename
 
+    _libusb_library_path_initialized = True
     return True
 
 
-def parse_definite_length_binary_block(data: bytes) -> bytes:
-    """Parse an SCPI Definite Length Binary Block (DLBB)."""
-    fi = BytesIO(data)
-    header = fi.read(2)
-    if len(header) != 2:
-        raise ValueError()
-    if not header.startswith(b'#'):
+def parse_definite_length_binary_block_view(data: bytes | bytearray | memoryview) -> memoryview:
+    """Parse an SCPI Definite Length Binary Block (DLBB), returning the payload as a view on the data.
+
+    Unlike parse_definite_length_binary_block(), this does not copy the payload, which can be several
+    megabytes in size for screendumps and waveforms.
+    """
+    if len(data) < 2 or data[0] != 0x23:  # 0x23 is '#'.
         raise ValueError()
-    num_size_digits = int(header[1:2])
-    if len(data) < 2 + num_size_digits:
+    # Decode the single size-digit-count digit directly; '#0' (indefinite length) is not supported.
+    num_size_digits = data[1] - 0x30
+    if not (1 <= num_size_digits <= 9):
         raise ValueError()
-    size_digits = fi.read(num_size_digits)
-    if len(size_digits) != num_size_digits:
+    header_size = 2 + num_size_digits
+    # Copy the size digits (at most 9 bytes) to a bytes instance; a memoryview supports neither isdigit() nor int().
+    size_digits = bytes(data[2:header_size])
+    # Only accept plain ASCII digits; int() would also accept signs, whitespace, and underscores.
+    # If the data is truncated within the size digits, either this check or the length check below fails.
+    if not size_digits.isdigit():
         raise ValueError()
     size = int(size_digits)
 
-    expected_size = 2 + num_size_digits + size
+    expected_size = header_size + size
     if len(data) != expected_size:
         raise ValueError()
 
-    block = fi.read(size)
-    return block
+    return memoryview(data)[header_size:]
 
 
-def make_definite_length_binary_block(data: bytes) -> bytes:
-    """Make an SCPI Definite Length Binary Block (DLBB)."""
-    fo = BytesIO()
+def parse_definite_length_binary_block(data: bytes | bytearray | memoryview) -> bytes:
+    """Parse an SCPI Definite Length Binary Block (DLBB)."""
+    return parse_definite_length_binary_block_view(data).tobytes()
 
-    size = len(data)
-    size_digits = str(size).encode('ascii')
-    size_digits_size_digit = str(len(size_digits)).encode('ascii')
 
-    fo.write(b'#')
-    fo.write(size_digits_size_digit)
-    fo.write(size_digits)
-    fo.write(data)
+def make_definite_length_binary_block_header(size: int) -> bytes:
+    """Make the header of an SCPI Definite Length Binary Block (DLBB) with a payload of the given size."""
+    size_digits = b'%d' % size
+    return b'#%d%s' % (len(size_digits), size_digits)
 
-    return fo.getvalue()
+
+def make_definite_length_binary_block(data: bytes | bytearray | memoryview) -> bytes:
+    """Make an SCPI Definite Length Binary Block (DLBB).
+
+    The payload size is the size of the data in bytes, irrespective of its item size.
+    """
+    size = memoryview(data).nbytes
+    return b"".join((make_definite_length_binary_block_header(size), data))
 
 
 def usbtmc_query(usbtmc_interface: UsbTmcInterface, command: str) -> str:
     usbtmc_interface.write_message(command)
     return usbtmc_interface.read_message()
+
+
+def usbtmc_compound_query(usbtmc_interface: UsbTmcInterface, commands: list[str]) -> list[str]:
+    """Send several SCPI queries as a single compound query, and return the individual responses.
+
+    The queries are joined by semicolons, and the device is expected to return the responses as a single
+    semicolon-separated message. This takes a single USB round-trip, rather than one for each query.
+
+    A ValueError is raised if the number of responses does not match the number of queries, for example
+    because one of the responses itself contains a semicolon.
+    """
+    response = usbtmc_query(usbtmc_interface, ";".join(commands))
+    responses = response.split(";")
+    if len(responses) != len(commands):
+        raise ValueError(f"Expected {len(commands)} responses to compound query, got {len(responses)}.")
+    return responses
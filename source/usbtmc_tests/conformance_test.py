@@ -215,7 +215,7 @@ def yesno(flag: bool) -> str:
     return "yes" if flag else "no"
 
 
-def test_device(vid: int, pid: int) -> None:
+def test_device(vid: int, pid: int, scan_all_strings: bool = False) -> None:
 
     # behavior = None
     behavior = UsbTmcInterfaceBehavior(
@@ -274,6 +274,12 @@ def test_device(vid: int, pid: int) -> None:
         print("------------------")
         print()
 
+        if scan_all_strings:
+            # Probe every possible string descriptor index, including indices not referenced by any descriptor.
+            descriptor_indices = range(1, 256)
+        else:
+            descriptor_indices = sorted(usbtmc_interface.get_used_string_indices())
+
         for langid in supported_languages:
             if langid in languages:
                 language_name = languages[langid]
@@ -282,9 +288,9 @@ def test_device(vid: int, pid: int) -> None:
 
             print(f"String descriptors defined for langid 0x{langid:04x}: {language_name}")
 
-            for descriptor_index in range(1, 256):
+            for descriptor_index in descriptor_indices:
                 try:
-                    descriptor_string = usbtmc_interface.get_string_descriptor(descriptor_index)
+                    descriptor_string = usbtmc_interface.get_string_descriptor(descriptor_index, langid)
                 except LibUsbLibraryFunctionCallError:
                     descriptor_string = None
 
@@ -324,6 +330,8 @@ def main():
 
     parser = argparse.ArgumentParser()
     parser.add_argument("devices", nargs="+")
+    parser.add_argument("--scan-all-strings", action="store_true",
+                        help="probe all string descriptor indices (1..255), not just the ones referenced by descriptors")
 
     args = parser.parse_args()
 
@@ -339,7 +347,7 @@ def main():
         vid = int(match.group(1), 16)
         pid = int(match.group(2), 16)
 
-        test_device(vid, pid)
+        test_device(vid, pid, args.scan_all_strings)
 
         # With this break present, we only test the first device specified on the command line.
         break
@@ -6,9 +6,9 @@ import time
 from typing import Optional
 
 from usbtmc import UsbTmcInterface
-from usbtmc.utilities import (usbtmc_query, parse_definite_length_binary_block,
+from usbtmc.utilities import (usbtmc_query, parse_definite_length_binary_block_view,
                               initialize_libusb_library_path_environment_variable,
-                              make_definite_length_binary_block)
+                              make_definite_length_binary_block_header)
 
 
 def test_identification(usbtmc_interface: UsbTmcInterface) -> None:
@@ -29,7 +29,7 @@ def test_screendump(usbtmc_interface: UsbTmcInterface) -> None:
         t1 = time.monotonic()
         response = usbtmc_interface.read_binary_message()
         t2 = time.monotonic()
-        image_data = parse_definite_length_binary_block(response)
+        image_data = parse_definite_length_binary_block_view(response)
         print(f"{image_format}: {len(image_data)} bytes in {t2 - t1:.3f} seconds.")
         with open(f"33622a_screendump.{image_format.lower()}", "wb") as fo:
             fo.write(image_data)
@@ -44,7 +44,8 @@ def test_waveform_upload(usbtmc_interface: UsbTmcInterface) -> None:
     usbtmc_interface.write_message("DATA:VOLATILE:CLEAR")
     usbtmc_interface.write_message("DATA:ARBITRARY2:FORMAT ABAB")
     t1 = time.monotonic()
-    usbtmc_interface.write_message(f"DATA:ARBITRARY2:DAC {waveform_name},", make_definite_length_binary_block(data))
+    # Pass the DLBB header and the data separately, to avoid making a full copy of the data just to prepend the header.
+    usbtmc_interface.write_message(f"DATA:ARBITRARY2:DAC {waveform_name},", make_definite_length_binary_block_header(len(data)), data)
     t2 = time.monotonic()
     print(f"Waveform upload: {len(data)} bytes in {t2 - t1:.3f} seconds.")
     print()
@@ -59,7 +60,7 @@ def run_tests(vid: int, pid: int, serial: Optional[str] = None) -> None:
     with UsbTmcInterface(vid=vid, pid=pid, serial=serial, min_bulk_speed=5.0) as usbtmc_interface:
 
         device_info = usbtmc_interface.get_device_info()
-        device_model = device_info.manufacturer + " " + device_info.product
+        device_model = device_info.model_string
 
         print()
         print(f"Running tests on device model: '{device_model}' ...")
@@ -6,7 +6,7 @@ import time
 from typing import Optional
 
 from usbtmc import UsbTmcInterface
-from usbtmc.utilities import usbtmc_query, parse_definite_length_binary_block, initialize_libusb_library_path_environment_variable
+from usbtmc.utilities import usbtmc_query, parse_definite_length_binary_block_view, initialize_libusb_library_path_environment_variable
 
 
 def test_identification(usbtmc_interface: UsbTmcInterface) -> None:
@@ -23,7 +23,7 @@ def test_screendump(usbtmc_interface: UsbTmcInterface) -> None:
         t1 = time.monotonic()
         response = usbtmc_interface.read_binary_message()
         t2 = time.monotonic()
-        image_data = parse_definite_length_binary_block(response)
+        image_data = parse_definite_length_binary_block_view(response)
         print(f"{image_format}: {len(image_data)} bytes in {t2 - t1:.3f} seconds.")
         with open(f"dho924s_screendump.{image_format.lower()}", "wb") as fo:
             fo.write(image_data)
@@ -38,7 +38,7 @@ def run_tests(vid: int, pid: int, serial: Optional[str] = None) -> None:
     with UsbTmcInterface(vid=vid, pid=pid, serial=serial) as usbtmc_interface:
 
         device_info = usbtmc_interface.get_device_info()
-        device_model = device_info.manufacturer + " " + device_info.product
+        device_model = device_info.model_string
 
         print()
         print(f"Running tests on device model: '{device_model}' ...")
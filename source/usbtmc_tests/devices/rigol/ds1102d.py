@@ -23,7 +23,7 @@ def run_tests(vid: int, pid: int, serial: Optional[str] = None) -> None:
     with UsbTmcInterface(vid=vid, pid=pid, serial=serial) as usbtmc_interface:
 
         device_info = usbtmc_interface.get_device_info()
-        device_model = device_info.manufacturer + " " + device_info.product
+        device_model = device_info.model_string
 
         print()
         print(f"Running tests on device model: '{device_model}' ...")
@@ -5,7 +5,7 @@
 from typing import Optional
 
 from usbtmc import UsbTmcInterface
-from usbtmc.utilities import initialize_libusb_library_path_environment_variable, usbtmc_query
+from usbtmc.utilities import initialize_libusb_library_path_environment_variable, usbtmc_query, usbtmc_compound_query
 
 
 def test_identification(usbtmc_interface: UsbTmcInterface) -> None:
@@ -24,13 +24,24 @@ def check_status(usbtmc_interface: UsbTmcInterface) -> None:
         ":SYSTEM:TIME?",
         ":CALIBRATION:STRING?",
         ":CORRECTION:WAVELENGTH?",
-        ":CORRECTION:BEAMDIAMETER?",
-        "*STB?"
+        ":CORRECTION:BEAMDIAMETER?"
     ]
 
+    try:
+        responses = usbtmc_compound_query(usbtmc_interface, commands)
+    except ValueError:
+        # The compound response could not be split into the individual responses. Send the queries one by one.
+        # Note that this only covers a miscounted split; a device that rejects compound queries altogether
+        # will fail with a timeout, which is not handled here.
+        responses = [usbtmc_query(usbtmc_interface, command) for command in commands]
+
+    # The status byte is queried separately. Within the compound query, the earlier responses would already be
+    # waiting in the output queue when *STB? executes, setting the MAV bit in the reported value.
+    commands.append("*STB?")
+    responses.append(usbtmc_query(usbtmc_interface, "*STB?"))
+
     print("Query commands:")
-    for command in commands:
-        response = usbtmc_query(usbtmc_interface, command)
+    for (command, response) in zip(commands, responses):
         print(f"  {command!r} -> {response!r}")
     print()
 
@@ -43,7 +54,7 @@ def run_tests(vid: int, pid: int, serial: Optional[str] = None) -> None:
     with UsbTmcInterface(vid=vid, pid=pid, serial=serial) as usbtmc_interface:
 
         device_info = usbtmc_interface.get_device_info()
-        device_model = device_info.manufacturer + " " + device_info.product
+        device_model = device_info.model_string
 
         print()
         print(f"Running tests on device model: '{device_model}' ...")
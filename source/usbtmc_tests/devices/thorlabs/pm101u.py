@@ -45,7 +45,7 @@ def run_tests(vid: int, pid: int, serial: Optional[str] = None) -> None:
         usbtmc_interface.remote_enable_control(True)
 
         device_info = usbtmc_interface.get_device_info()
-        device_model = device_info.manufacturer + " " + device_info.product
+        device_model = device_info.model_string
 
         print()
         print(f"Running tests on device model: '{device_model}' ...")
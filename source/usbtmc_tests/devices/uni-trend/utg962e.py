@@ -30,16 +30,18 @@ def fix_screendump_data(image_data: bytes) -> bytes:
     struct.pack_into("<L", image_data, 2, len(image_data))
 
     # Mirror image horizontally and rearrange pixel color ordering: (B/R/G) -> (B/G/R).
+    # We process the image one row at a time using extended slices, rather than one pixel at a time.
+    # Each color channel is read from the row in reverse pixel order with a single negative-stride slice.
+    row_size = 480 * 3
     for y in range(272):
-        for x in range(240):
-            offset1 = 54 + 3 * (y * 480 + x)
-            offset2 = 54 + 3 * (y * 480 + (479 - x))
-
-            (b1, r1, g1) = struct.unpack_from("BBB", image_data, offset1)
-            (b2, r2, g2) = struct.unpack_from("BBB", image_data, offset2)
-
-            struct.pack_into("BBB", image_data, offset1, b2, g2, r2)
-            struct.pack_into("BBB", image_data, offset2, b1, g1, r1)
+        offset = 54 + y * row_size
+        last = offset + row_size - 1  # Offset of the last byte (the G value) of the last pixel in the row.
+        g = image_data[last - 0:offset - 1:-3]
+        r = image_data[last - 1:offset - 1:-3]
+        b = image_data[last - 2:offset - 1:-3]
+        image_data[offset + 0:offset + row_size:3] = b
+        image_data[offset + 1:offset + row_size:3] = g
+        image_data[offset + 2:offset + row_size:3] = r
 
     # We now have a valid BMP file.
     return bytes(image_data)
@@ -75,7 +77,7 @@ def run_tests(vid: int, pid: int, serial: Optional[str] = None) -> None:
     with UsbTmcInterface(vid=vid, pid=pid, serial=serial) as usbtmc_interface:
 
         device_info = usbtmc_interface.get_device_info()
-        device_model = device_info.manufacturer + " " + device_info.product
+        device_model = device_info.model_string
 
         print()
         print(f"Running tests on device model: '{device_model}' ...")